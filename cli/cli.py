@@ -1,7 +1,6 @@
 import argparse
 from datetime import datetime
 
-from models.common import publish_calendar_image
 from utils.logger import setup_logger
 
 logger = setup_logger(name="cli_logger")
@@ -52,6 +51,10 @@ def parse_args():
 
 if __name__ == "__main__":
     args = parse_args()
+
+    # Imported after argument parsing so --help does not pay for PIL
+    from models.common import publish_calendar_image
+
     publish_calendar_image(
         year=args.year,
         month=args.month,
@@ -7,8 +7,8 @@ from tkcalendar import DateEntry
 from ttkthemes import ThemedTk
 
 from config.config import Config
-from models.common import publish_calendar_image
 from utils.logger import setup_logger
+from utils.shared_utils import parse_event_datetime
 
 logger = setup_logger(name="gui_logger")
 
@@ -25,26 +25,62 @@ class Gui(ThemedTk):
         self.resizable(False, False)
         self.configure(padx=20, pady=20)
 
+        # One connection for the lifetime of the window
+        self.conn = sqlite3.connect(self.cfg.EVENTS_DB_FILE)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.init_db()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
+
         logger.info("CalendarApp initialized.")
         self.create_widgets()
         self.load_events()
 
     # ---------- Database Setup ----------
     def init_db(self):
-        with sqlite3.connect(self.cfg.EVENTS_DB_FILE) as conn:
-            c = conn.cursor()
-            c.execute(
-                """
-                CREATE TABLE IF NOT EXISTS events (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    title TEXT NOT NULL,
-                    event_datetime TEXT NOT NULL
-                )
-                """
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT NOT NULL,
+                event_datetime TEXT NOT NULL
             )
-            conn.commit()
+            """
+        )
+        # Covering index for the calendar's date range query: it is answered
+        # from the index alone, already in event_datetime order
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_events_dt_title "
+            "ON events(event_datetime, title)"
+        )
+        self.conn.commit()
+        self.normalize_event_datetimes()
         logger.info(f"Database initialized with file {self.cfg.EVENTS_DB_FILE}")
 
+    def normalize_event_datetimes(self):
+        # The calendar selects a month by comparing strings, so rows saved
+        # unpadded by older versions (e.g. "2025-9-28 7:00") would fall outside
+        # it; rewrite them once as "YYYY-MM-DD HH:MM"
+        rows = self.conn.execute(
+            "SELECT id, event_datetime FROM events WHERE event_datetime NOT GLOB "
+            "'[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9] [0-9][0-9]:[0-9][0-9]'"
+        ).fetchall()
+        updates = []
+        for event_id, datetime_str in rows:
+            try:
+                dt = parse_event_datetime(datetime_str.strip())
+            except ValueError:
+                logger.error(f"Invalid datetime format in DB: {datetime_str}")
+                continue
+            updates.append((dt.strftime("%Y-%m-%d %H:%M"), event_id))
+
+        if updates:
+            self.conn.executemany(
+                "UPDATE events SET event_datetime = ? WHERE id = ?", updates
+            )
+            self.conn.commit()
+            logger.info(f"Normalized {len(updates)} event datetimes.")
+
     def create_widgets(self):
         # ----- Input Frame -----
         input_frame = ttk.LabelFrame(self, text="Add/Edit Event")
@@ -159,17 +195,16 @@ class Gui(ThemedTk):
 
     def load_events(self):
         self.tree.delete(*self.tree.get_children())
-        with sqlite3.connect(self.cfg.EVENTS_DB_FILE) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT id, event_datetime, title FROM events ORDER BY event_datetime ASC"
-            )
-            rows = cursor.fetchall()
-            logger.debug(f"database {self.cfg.EVENTS_DB_FILE}")
-            logger.info(f"Loaded {len(rows)} events from database.")
+        rows = self.conn.execute(
+            "SELECT id, event_datetime, title FROM events ORDER BY event_datetime ASC"
+        ).fetchall()
+        logger.debug(f"database {self.cfg.EVENTS_DB_FILE}")
+        logger.info(f"Loaded {len(rows)} events from database.")
 
-            for row in rows:
-                self.tree.insert("", "end", values=row)
+        # Bind insert once to skip the attribute lookup on every row
+        insert = self.tree.insert
+        for row in rows:
+            insert("", "end", values=row)
 
     def add_event(self):
         title = self.title_entry.get().strip()
@@ -184,14 +219,13 @@ class Gui(ThemedTk):
             logger.error(f"Invalid datetime format: {datetime_str}")
             messagebox.showerror("Invalid Date", "Date and time format is incorrect.")
             return
+        datetime_str = self.normalize_datetime(datetime_str)
 
-        with sqlite3.connect(self.cfg.EVENTS_DB_FILE) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO events (title, event_datetime) VALUES (?, ?)",
-                (title, datetime_str),
-            )
-            conn.commit()
+        self.conn.execute(
+            "INSERT INTO events (title, event_datetime) VALUES (?, ?)",
+            (title, datetime_str),
+        )
+        self.conn.commit()
 
         logger.info(f"Added event: {title} at {datetime_str}")
         self.clear_inputs()
@@ -218,14 +252,13 @@ class Gui(ThemedTk):
             logger.error(f"Invalid datetime format for update: {datetime_str}")
             messagebox.showerror("Invalid Date", "Date and time format is incorrect.")
             return
+        datetime_str = self.normalize_datetime(datetime_str)
 
-        with sqlite3.connect(self.cfg.EVENTS_DB_FILE) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "UPDATE events SET title = ?, event_datetime = ? WHERE id = ?",
-                (title, datetime_str, event_id),
-            )
-            conn.commit()
+        self.conn.execute(
+            "UPDATE events SET title = ?, event_datetime = ? WHERE id = ?",
+            (title, datetime_str, event_id),
+        )
+        self.conn.commit()
 
         logger.info(
             f"Updated event ID {event_id} with title: {title} at {datetime_str}"
@@ -247,15 +280,21 @@ class Gui(ThemedTk):
             "Confirm Delete", "Are you sure you want to delete this event?"
         )
         if confirm:
-            with sqlite3.connect(self.cfg.EVENTS_DB_FILE) as conn:
-                cursor = conn.cursor()
-                cursor.execute("DELETE FROM events WHERE id = ?", (event_id,))
-                conn.commit()
+            self.conn.execute("DELETE FROM events WHERE id = ?", (event_id,))
+            self.conn.commit()
             logger.info(f"Deleted event ID {event_id}")
 
         self.clear_inputs()
         self.load_events()
 
+    def _bulk_insert(self, items):
+        """Inserts many (title, event_datetime) pairs in a single transaction."""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO events (title, event_datetime) VALUES (?, ?)", items
+            )
+        logger.info("Bulk inserted events.")
+
     def on_event_select(self, event):
         selected = self.tree.selection()
         if not selected:
@@ -269,7 +308,7 @@ class Gui(ThemedTk):
         self.title_entry.insert(0, title)
 
         try:
-            dt = datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
+            dt = parse_event_datetime(datetime_str)
             self.date_entry.set_date(dt.date())
             self.hour_var.set(f"{dt.hour:02}")
             self.minute_var.set(f"{dt.minute:02}")
@@ -292,7 +331,15 @@ class Gui(ThemedTk):
         except ValueError:
             return False
 
+    def normalize_datetime(self, dt_str):
+        # Stored zero-padded ("YYYY-MM-DD HH:MM") so the calendar's string
+        # range query sees it; the hour combobox accepts typed values like "7"
+        return datetime.strptime(dt_str, "%Y-%m-%d %H:%M").strftime("%Y-%m-%d %H:%M")
+
     def publish_calendar(self):
+        # Deferred: pulls in PIL and the image generator only when publishing
+        from models.common import publish_calendar_image
+
         try:
             publish_calendar_image(
                 year=datetime.today().year,
@@ -313,6 +360,11 @@ class Gui(ThemedTk):
         self.minute_var.set("00")
         logger.debug("Set event to full day.")
 
+    def _on_close(self):
+        self.conn.close()
+        logger.info("Database connection closed.")
+        self.destroy()
+
 
 # ---------- Main ----------
 if __name__ == "__main__":
@@ -1,59 +1,220 @@
 import calendar
+import functools
 import sqlite3
-from datetime import datetime, timedelta
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from pathlib import Path
 
 from PIL import Image, ImageDraw, ImageFont
 
 from utils.logger import setup_logger
-from utils.shared_utils import hex_to_rgb
+from utils.shared_utils import hex_to_rgb_many, parse_event_datetime
 
 logger = setup_logger(name="imagegen_logger")
 
+# Encoder settings per output format. The wallpaper is mostly flat color, so
+# fast PNG compression costs little size; JPEG skips the optimize pass.
+_SAVE_OPTIONS: dict[str, dict] = {
+    ".png": {"compress_level": 1},
+    ".jpg": {"quality": 85, "subsampling": 2, "optimize": False},
+    ".jpeg": {"quality": 85, "subsampling": 2, "optimize": False},
+}
+
+# Fonts registered for the wrap cache, keyed by id() (kept alive by this dict)
+_FONTS: dict[int, ImageFont.ImageFont] = {}
+
+
+def _font_key(font: ImageFont.ImageFont) -> int:
+    """
+    Returns a stable hashable key for the font, registering it for cache lookups.
+    """
+    key = id(font)
+    _FONTS.setdefault(key, font)
+    return key
+
+
+@functools.lru_cache(maxsize=4096)
+def _text_length(text: str, font_key: int) -> float:
+    """
+    Returns the advance width of text. Memoized, since words such as times and
+    common titles repeat across different events.
+    """
+    return _FONTS[font_key].getlength(text)
+
+
+@functools.lru_cache(maxsize=1024)
+def _wrap_text_cached(text: str, max_w_int: int, font_key: int) -> tuple[str, ...]:
+    """
+    Wraps text into lines no wider than max_w_int pixels. Memoized, since the
+    same event strings are wrapped with the same font and width on every draw.
+    """
+    space_width = _text_length(" ", font_key)
+    lines = []
+    current_line = ""
+    current_width = 0.0
+
+    for word in text.split():
+        word_width = _text_length(word, font_key)
+
+        if current_line and current_width + space_width + word_width <= max_w_int:
+            current_line = f"{current_line} {word}"
+            current_width += space_width + word_width
+        else:
+            if current_line:
+                lines.append(current_line)
+            current_line = word  # Start a new line with the current word
+            current_width = word_width
+
+    if current_line:
+        lines.append(current_line)
+
+    return tuple(lines)
+
+
+@functools.cache
+def _load_font(font_file: Path, size: int) -> ImageFont.FreeTypeFont:
+    """
+    Loads a TrueType font. Cached, so each (file, size) is parsed once per process.
+    """
+    return ImageFont.truetype(font_file, size)
+
+
+@functools.cache
+def _load_default_font() -> ImageFont.ImageFont:
+    """
+    Loads Pillow's built-in default font once per process.
+    """
+    return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=12)
+def _month_weeks(
+    year: int, month: int, start_of_week: int, min_rows: int
+) -> tuple[tuple[datetime.date, ...], ...]:
+    """
+    Returns the weeks of the month (including adjacent-month days), padded with
+    following weeks up to min_rows. Cached, since re-renders reuse the same months.
+    """
+    weeks = calendar.Calendar(firstweekday=start_of_week).monthdatescalendar(
+        year, month
+    )
+    while len(weeks) < min_rows:
+        last_date = weeks[-1][-1]
+        weeks.append([last_date + timedelta(days=i) for i in range(1, 8)])
+    return tuple(tuple(week) for week in weeks)
+
+
+@functools.lru_cache(maxsize=7)
+def _weekday_labels(start_of_week: int) -> tuple[str, ...]:
+    """
+    Returns the abbreviated weekday names starting from start_of_week.
+    """
+    return tuple(calendar.day_abbr[(start_of_week + i) % 7] for i in range(7))
+
 
 class CalendarImageGen:
     def __init__(self, config):
-        # Load config and convert hex colors to RGB
+        # Keep config read-only; converted RGB colors live on the instance
         self.cfg = config
-        self.cfg.BACKGROUND_COLOR = hex_to_rgb(config.BACKGROUND_COLOR)
-        self.cfg.TEXT_COLOR = hex_to_rgb(config.TEXT_COLOR)
-        self.cfg.EVENT_COLOR = hex_to_rgb(config.EVENT_COLOR)
-        self.cfg.GRID_COLOR = hex_to_rgb(config.GRID_COLOR)
-        self.cfg.TODAY_CELL_BG_COLOR = hex_to_rgb(config.TODAY_CELL_BG_COLOR)
-        self.cfg.TODAY_EVENT_COLOR = hex_to_rgb(config.TODAY_EVENT_COLOR)
+        (
+            self.background_color,
+            self.text_color,
+            self.event_color,
+            self.grid_color,
+            self.today_cell_bg_color,
+            self.today_event_color,
+        ) = hex_to_rgb_many(
+            (
+                config.BACKGROUND_COLOR,
+                config.TEXT_COLOR,
+                config.EVENT_COLOR,
+                config.GRID_COLOR,
+                config.TODAY_CELL_BG_COLOR,
+                config.TODAY_EVENT_COLOR,
+            )
+        )
+
+        # Dimmed variants for days outside the displayed month
+        # Halving is a right shift; 0.6 has no shift equivalent
+        self._dim_text_color = tuple(c >> 1 for c in self.text_color)
+        self._dim_event_color = tuple(max(0, int(c * 0.6)) for c in self.event_color)
+
+        # Per-instance tile cache: cells with the same content are rendered once
+        self._render_cell = functools.lru_cache(maxsize=256)(self._render_cell)
+        # Rasterized text masks for short repeated labels (day numbers, weekdays)
+        self._glyph_cache: dict[tuple[str, int], tuple[Image.Image, int, int]] = {}
+        # Static background/title/headers image for the last drawn month
+        self._template_key: tuple[int, int, int] | None = None
+        self._template_image: Image.Image | None = None
+        # Events database connection, opened on first read
+        self._conn: sqlite3.Connection | None = None
+        self._conn_path: str | Path | None = None
 
     # ------------- READ EVENTS ----------------
+    def _get_connection(self, db_path: str | Path) -> sqlite3.Connection:
+        """
+        Returns the connection to db_path, kept open across reads. Reading never
+        writes: the WAL journal and the covering index are set up by Gui.init_db
+        when the GUI opens the database; without the index the range query
+        falls back to a table scan.
+        """
+        if self._conn is not None and self._conn_path == db_path:
+            return self._conn
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn_path = db_path
+        return self._conn
+
     def read_events_db(
-        self, db_path: str | None = None
-    ) -> dict[datetime.date, list[str]]:
+        self, year: int, month: int, db_path: str | None = None
+    ) -> dict[datetime.date, list[str]] | None:
         """
         Reads events from an SQLite database and returns them in a dictionary format.
+        Only events from the previous month through the next month are loaded,
+        which covers every date shown on the calendar grid for year/month.
+        The window compares strings, so rows must be stored zero-padded
+        ("YYYY-MM-DD HH:MM"); Gui.init_db rewrites older unpadded rows.
+        Returns None if the database could not be read.
         """
-        events: dict[datetime.date, list[str]] = {}
+        events: dict[datetime.date, list[str]] = defaultdict(list)
+
+        # Month window [first day of previous month, first day of month + 2)
+        start_year, start_month = divmod(year * 12 + month - 2, 12)
+        end_year, end_month = divmod(year * 12 + month + 1, 12)
+        start = date(start_year, start_month + 1, 1).isoformat()
+        end = date(end_year, end_month + 1, 1).isoformat()
 
         try:
             if not db_path:
                 db_path = self.cfg.EVENTS_DB_FILE
 
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-            cursor.execute("SELECT event_datetime, title FROM events")
-            rows = cursor.fetchall()
-            for date_str, title in rows:
+            cursor = self._get_connection(db_path).cursor()
+            cursor.execute(
+                "SELECT event_datetime, title FROM events "
+                "WHERE event_datetime >= ? AND event_datetime < ? "
+                "ORDER BY event_datetime",
+                (start, end),
+            )
+            # Iterate the cursor directly instead of building a list of all rows
+            for date_str, title in cursor:
                 try:
-                    dt = datetime.strptime(date_str.strip(), "%Y-%m-%d %H:%M")
-                    event_list = events.setdefault(dt.date(), [])
-                    if dt.strftime("%H:%M") == "00:00":
-                        event_list.append(title.strip())
+                    dt = parse_event_datetime(date_str.strip())
+                    if dt.hour == 0 and dt.minute == 0:  # Full day event
+                        events[dt.date()].append(title.strip())
                     else:
-                        event_list.append(f"{dt.strftime('%H:%M')} - {title.strip()}")
+                        events[dt.date()].append(
+                            f"{dt.hour:02d}:{dt.minute:02d} - {title.strip()}"
+                        )
                 except ValueError:
                     logger.error(f"⚠️ Invalid datetime format in DB: {date_str}")
 
-            conn.close()
             logger.info(f"Events read from database: {db_path}")
         except Exception as e:
             logger.error(f"Failed to read events from database: {db_path}. Error: {e}")
+            return None
         return events
 
     # ------------- CALENDAR GRID GENERATION ----------------
@@ -65,37 +226,8 @@ class CalendarImageGen:
         Days outside the target month are represented as actual dates from adjacent months.
         Returns a list of 6 weeks, each with 7 days (dates).
         """
-        # Set the first weekday
-        cal = calendar.Calendar(firstweekday=start_of_week)
-        # Get all days in the month as date objects
-        month_dates = cal.itermonthdates(year, month)
-        # This returns ~6 weeks of dates, including prev/next month
-        all_dates = list(month_dates)
-
-        min_days = self.cfg.CALENDAR_MIN_NUM_ROWS * 7  # e.g., 6 * 7 = 42
-
-        if len(all_dates) < min_days:
-            # Pad with next month days until we reach min_days
-            last_date = all_dates[-1]
-            while len(all_dates) < min_days:
-                last_date += timedelta(days=1)
-                all_dates.append(last_date)
-        # If >= min_days, use as-is (no truncation)
-
-        # Split into weeks
-        weeks = []
-        for i in range(0, len(all_dates), 7):
-            week = all_dates[i : i + 7]
-            # Ensure every week has exactly 7 days (should always be true)
-            if len(week) == 7:
-                weeks.append(week)
-            else:
-                # Safety: pad incomplete final week (shouldn't happen)
-                while len(week) < 7:
-                    week.append(week[-1] + timedelta(days=1))
-                weeks.append(week)
-
-        return weeks
+        weeks = _month_weeks(year, month, start_of_week, self.cfg.CALENDAR_MIN_NUM_ROWS)
+        return [list(week) for week in weeks]
 
     # ------------- DRAW CALENDAR ----------------
     def draw_calendar(
@@ -114,38 +246,14 @@ class CalendarImageGen:
         # Get today's date for highlighting
         today = datetime.today().date()
 
-        # Create image
-        calendar_image = Image.new(
-            "RGB",
-            (self.cfg.IMG_WIDTH, self.cfg.IMG_HEIGHT),
-            self.cfg.BACKGROUND_COLOR,
-        )
-        draw = ImageDraw.Draw(calendar_image)
-
         # Load fonts
-        title_font, day_font, event_font = self.load_fonts()
+        title_font, day_font, event_font = self._fonts
 
-        # 1. Draw title
-        month_year_title = f"{calendar.month_name[month]} {year}"
-        title_width, title_height = self.get_text_size(
-            draw, month_year_title, title_font
-        )
-        title_position = (
-            (self.cfg.IMG_WIDTH - title_width) / 2,
-            self.cfg.MARGIN_TOP,
-        )
-        draw.text(
-            title_position,
-            month_year_title,
-            fill=self.cfg.TEXT_COLOR,
-            font=title_font,
-        )
-
-        # 2. Generate 6-week date grid
+        # 1. Generate 6-week date grid
         date_grid = self.generate_calendar_grid(year, month, start_of_week)
         num_rows = len(date_grid)
 
-        # 3. Calculate cell dimensions (always 6 rows)
+        # 2. Calculate cell dimensions (always 6 rows)
         cell_width = (
             self.cfg.IMG_WIDTH - self.cfg.MARGIN_LEFT - self.cfg.MARGIN_RIGHT
         ) / 7
@@ -153,12 +261,19 @@ class CalendarImageGen:
             self.cfg.IMG_HEIGHT - self.cfg.MARGIN_TOP - self.cfg.MARGIN_BOTTOM - 100
         ) / num_rows  # Use actual row count (≥ MIN)
 
-        # 4. Draw weekday headers
-        self.draw_weekday_headers(draw, day_font, cell_width, start_of_week)
+        # 3. Background, title and weekday headers: built once per month and
+        # copied on later draws
+        template_key = (year, month, start_of_week)
+        if self._template_key != template_key:
+            self._template_image = self._build_template(
+                year, month, start_of_week, cell_width, title_font, day_font
+            )
+            self._template_key = template_key
+        calendar_image = self._template_image.copy()
 
-        # 5. Draw day boxes and events
+        # 4. Draw day boxes and events
         self.draw_day_boxes_and_events(
-            draw,
+            calendar_image,
             year,
             month,
             date_grid,
@@ -170,10 +285,52 @@ class CalendarImageGen:
             today,  # Pass today's date for comparison
         )
 
-        # 6. Save image
-        calendar_image.save(self.cfg.WALLPAPER_FILE)
+        # 5. Save image
+        save_options = _SAVE_OPTIONS.get(self.cfg.WALLPAPER_FILE.suffix.lower(), {})
+        calendar_image.save(self.cfg.WALLPAPER_FILE, **save_options)
         logger.info(f"✅ Calendar image saved as {self.cfg.WALLPAPER_FILE}")
 
+    def _build_template(
+        self,
+        year: int,
+        month: int,
+        start_of_week: int,
+        cell_width: float,
+        title_font: ImageFont.ImageFont,
+        day_font: ImageFont.ImageFont,
+    ) -> Image.Image:
+        """
+        Draws the static part of the calendar (background, title, weekday headers).
+        """
+        template = Image.new(
+            "RGB",
+            (self.cfg.IMG_WIDTH, self.cfg.IMG_HEIGHT),
+            self.background_color,
+        )
+        draw = ImageDraw.Draw(template)
+
+        month_year_title = f"{calendar.month_name[month]} {year}"
+        # Anchor "ma" centers the text horizontally on x, no measurement pass needed
+        draw.text(
+            (self.cfg.IMG_WIDTH / 2, self.cfg.MARGIN_TOP),
+            month_year_title,
+            fill=self.text_color,
+            font=title_font,
+            anchor="ma",
+        )
+
+        self.draw_weekday_headers(template, day_font, cell_width, start_of_week)
+        return template
+
+    @functools.cached_property
+    def _fonts(
+        self,
+    ) -> tuple[ImageFont.ImageFont, ImageFont.ImageFont, ImageFont.ImageFont]:
+        """
+        Title, day and event fonts, loaded on first draw and kept for the instance.
+        """
+        return self.load_fonts()
+
     def load_fonts(
         self,
     ) -> tuple[ImageFont.ImageFont, ImageFont.ImageFont, ImageFont.ImageFont]:
@@ -181,36 +338,18 @@ class CalendarImageGen:
         Loads the fonts safely for the calendar image.
         """
         try:
-            title_font = ImageFont.truetype(
-                self.cfg.FONT_FILE, self.cfg.MONTH_TITLE_FONT_SIZE
-            )
-            day_font = ImageFont.truetype(self.cfg.FONT_FILE, self.cfg.DAY_FONT_SIZE)
-            event_font = ImageFont.truetype(
-                self.cfg.FONT_FILE, self.cfg.EVENT_FONT_SIZE
-            )
+            title_font = _load_font(self.cfg.FONT_FILE, self.cfg.MONTH_TITLE_FONT_SIZE)
+            day_font = _load_font(self.cfg.FONT_FILE, self.cfg.DAY_FONT_SIZE)
+            event_font = _load_font(self.cfg.FONT_FILE, self.cfg.EVENT_FONT_SIZE)
         except Exception:  # In case fonts fail to load, use default fonts
-            title_font = ImageFont.load_default()
-            day_font = ImageFont.load_default()
-            event_font = ImageFont.load_default()
+            title_font = day_font = event_font = _load_default_font()
             logger.warning("Fonts could not be loaded. Using default fonts.")
 
         return title_font, day_font, event_font
 
-    def get_text_size(
-        self, draw: ImageDraw.ImageDraw, text: str, font: ImageFont.ImageFont
-    ) -> tuple[int, int]:
-        """
-        Calculates the width and height of the text using the given font.
-        """
-        try:
-            bbox = draw.textbbox((0, 0), text, font=font)
-            return bbox[2] - bbox[0], bbox[3] - bbox[1]
-        except AttributeError:
-            return draw.textsize(text, font=font)
-
     def draw_weekday_headers(
         self,
-        draw: ImageDraw.ImageDraw,
+        calendar_image: Image.Image,
         day_font: ImageFont.ImageFont,
         cell_width: float,
         start_of_week: int,
@@ -218,51 +357,51 @@ class CalendarImageGen:
         """
         Draws the weekday headers (Mon, Tue, ..., Sun) on the calendar.
         """
-        weekdays = []
-        for i in range(7):
-            day_index = (start_of_week + i) % 7
-            weekdays.append(calendar.day_abbr[day_index])
-
-        for i, day_name in enumerate(weekdays):
+        for i, day_name in enumerate(_weekday_labels(start_of_week)):
             x = self.cfg.MARGIN_LEFT + i * cell_width + 20
-            draw.text(
+            self._blit(
+                calendar_image,
                 (x + 20, self.cfg.MARGIN_TOP + 60),
                 day_name,
-                fill=self.cfg.TEXT_COLOR,
-                font=day_font,
+                day_font,
+                self.text_color,
             )
 
+    def _blit(
+        self,
+        image: Image.Image,
+        xy: tuple[float, float],
+        text: str,
+        font: ImageFont.ImageFont,
+        color: tuple[int, int, int],
+    ) -> None:
+        """
+        Pastes text at xy (left/ascender anchored, like draw.text) using a cached
+        mask, so each label is rasterized by FreeType only once per font.
+        """
+        key = (text, _font_key(font))
+        glyph = self._glyph_cache.get(key)
+        if glyph is None:
+            left, top, right, bottom = font.getbbox(text)
+            mask = Image.new("L", (right - left, bottom - top))
+            ImageDraw.Draw(mask).text((-left, -top), text, fill=255, font=font)
+            glyph = self._glyph_cache[key] = (mask, left, top)
+
+        mask, left, top = glyph
+        x, y = round(xy[0]) + left, round(xy[1]) + top
+        image.paste(color, (x, y, x + mask.width, y + mask.height), mask)
+
     def wrap_text(
         self, text: str, max_pixel_width: float, font: ImageFont.ImageFont
     ) -> list[str]:
         """
         Wrap text into multiple lines so that each line fits within the given pixel width.
         """
-        draw = ImageDraw.Draw(Image.new("RGB", (1, 1)))
-        words = text.split()
-        lines = []
-        current_line = ""
-
-        for word in words:
-            test_line = f"{current_line} {word}".strip()
-            bbox = draw.textbbox((0, 0), test_line, font=font)
-            line_width = bbox[2] - bbox[0]
-
-            if line_width <= max_pixel_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word  # Start a new line with the current word
-
-        if current_line:
-            lines.append(current_line)
-
-        return lines
+        return list(_wrap_text_cached(text, int(max_pixel_width), _font_key(font)))
 
     def draw_day_boxes_and_events(
         self,
-        draw: ImageDraw.ImageDraw,
+        calendar_image: Image.Image,
         year: int,
         month: int,
         date_grid: list[list[datetime.date]],
@@ -276,77 +415,130 @@ class CalendarImageGen:
         """
         Draws calendar cells using actual datetime.date objects.
         Handles current/adjacent months and event rendering.
+        Each cell is rendered as a tile (cached by content) and pasted onto the image,
+        then the grid borders are drawn once on top.
         """
+        # Cell edges, computed once: column i spans x_coords[i]..x_coords[i + 1].
+        # The far edge is the last cell's left/top plus its size
+        x_edges = [self.cfg.MARGIN_LEFT + i * cell_width for i in range(7)]
+        x_edges.append(x_edges[-1] + cell_width)
+        y_edges = [
+            self.cfg.MARGIN_TOP + 100 + j * cell_height for j in range(len(date_grid))
+        ]
+        y_edges.append(y_edges[-1] + cell_height)
+        x_coords = [round(x) for x in x_edges]
+        y_coords = [round(y) for y in y_edges]
+        max_event_width = int(cell_width - 20)
+
+        # Bound once: these are looked up for every one of the grid's cells
+        render_cell = self._render_cell
+        paste = calendar_image.paste
+        get_events = event_dict.get
+
+        # Grid position of today, if shown; at most one cell can match
+        today_cell = next(
+            (
+                (week_idx, week_dates.index(today))
+                for week_idx, week_dates in enumerate(date_grid)
+                if today in week_dates
+            ),
+            None,
+        )
+
         for week_idx, week_dates in enumerate(date_grid):
+            cell_top, cell_bottom = y_coords[week_idx], y_coords[week_idx + 1]
             for day_idx, actual_date in enumerate(week_dates):
-                cell_left = self.cfg.MARGIN_LEFT + day_idx * cell_width
-                cell_top = self.cfg.MARGIN_TOP + 100 + week_idx * cell_height
-                cell_right = cell_left + cell_width
-                cell_bottom = cell_top + cell_height
-
-                in_current_month = (
-                    actual_date.year == year and actual_date.month == month
+                cell_left, cell_right = x_coords[day_idx], x_coords[day_idx + 1]
+
+                tile = render_cell(
+                    actual_date.day,
+                    tuple(get_events(actual_date, ())),
+                    (week_idx, day_idx) == today_cell,
+                    actual_date.year == year and actual_date.month == month,
+                    (cell_right - cell_left, cell_bottom - cell_top),
+                    max_event_width,
+                    day_font,
+                    event_font,
                 )
-                is_current_day = actual_date == today
-
-                # Draw cell background
-                if is_current_day:
-                    draw.rectangle(
-                        [cell_left, cell_top, cell_right, cell_bottom],
-                        fill=self.cfg.TODAY_CELL_BG_COLOR,
-                        outline=self.cfg.GRID_COLOR,
-                        width=2,
-                    )
-                else:
-                    draw.rectangle(
-                        [cell_left, cell_top, cell_right, cell_bottom],
-                        outline=self.cfg.GRID_COLOR,
-                        width=2,
-                    )
-
-                # Draw day number
-                day_text_color = (
-                    self.cfg.TEXT_COLOR
-                    if in_current_month
-                    else tuple(max(0, int(c * 0.5)) for c in self.cfg.TEXT_COLOR)
-                )
-                draw.text(
-                    (cell_left + 7, cell_top + 5),
-                    str(actual_date.day),
-                    fill=day_text_color,
-                    font=day_font,
+                paste(tile, (cell_left, cell_top))
+
+        # Grid borders: one band per column/row edge instead of a rectangle
+        # outline per cell. Matches the 2px outlines: 3px where two cells
+        # meet, 2px on the outer edges, kept inside the grid
+        draw = ImageDraw.Draw(calendar_image)
+        grid_color = self.grid_color
+        # Border positions are truncated, as PIL does with float outline coords
+        x_lines = [int(x) for x in x_edges]
+        y_lines = [int(y) for y in y_edges]
+        grid_top, grid_bottom = y_lines[0], y_lines[-1]
+        grid_left, grid_right = x_lines[0], x_lines[-1]
+        for x in x_lines:
+            left = x if x == grid_left else x - 1
+            right = x if x == grid_right else x + 1
+            draw.rectangle([left, grid_top, right, grid_bottom], fill=grid_color)
+        for y in y_lines:
+            top = y if y == grid_top else y - 1
+            bottom = y if y == grid_bottom else y + 1
+            draw.rectangle([grid_left, top, grid_right, bottom], fill=grid_color)
+
+    def _render_cell(
+        self,
+        day: int,
+        events: tuple[str, ...],
+        is_current_day: bool,
+        in_current_month: bool,
+        size: tuple[int, int],
+        max_event_width: int,
+        day_font: ImageFont.ImageFont,
+        event_font: ImageFont.ImageFont,
+    ) -> Image.Image:
+        """
+        Renders a single day cell (background, day number and events) into its own
+        image. Grid borders are drawn separately over the pasted tiles.
+        Wrapped with an LRU cache in __init__, so identical cells are drawn once.
+        """
+        tile = Image.new(
+            "RGB",
+            size,
+            (self.today_cell_bg_color if is_current_day else self.background_color),
+        )
+        draw = ImageDraw.Draw(tile)
+        cell_bottom = size[1]
+
+        # Draw day number
+        day_text_color = self.text_color if in_current_month else self._dim_text_color
+        self._blit(tile, (7, 5), str(day), day_font, day_text_color)
+
+        # Draw events
+        if events:
+            event_y_position = 25
+            event_x_offset = 10
+            # Dim events for non-current-month days (unless it's today)
+            if is_current_day:
+                fill_color = self.today_event_color
+            elif in_current_month:
+                fill_color = self.event_color
+            else:
+                fill_color = self._dim_event_color
+
+            # Collect every wrapped line that fits, then draw them in one call
+            line_height = 12
+            max_lines = max(0, (cell_bottom - event_y_position) // line_height)
+            lines = []
+            for event in events:
+                lines.extend(self.wrap_text(event, max_event_width, event_font))
+            if len(lines) > max_lines:
+                logger.warning(f"Event text overflowed in cell: day {day}.")
+                del lines[max_lines:]
+
+            if lines:
+                # Pillow advances multiline text by the height of "A" plus spacing
+                draw.multiline_text(
+                    (event_x_offset, event_y_position),
+                    "\n".join(lines),
+                    fill=fill_color,
+                    font=event_font,
+                    spacing=line_height - event_font.getbbox("A")[3],
                 )
 
-                # Draw events
-                if actual_date in event_dict:
-                    event_y_position = cell_top + 25
-                    event_x_offset = 10
-                    max_event_width = cell_width - 20
-                    fill_color = (
-                        self.cfg.TODAY_EVENT_COLOR
-                        if is_current_day
-                        else self.cfg.EVENT_COLOR
-                    )
-                    # Dim events for non-current-month days (unless it's today)
-                    if not in_current_month and not is_current_day:
-                        fill_color = tuple(max(0, int(c * 0.6)) for c in fill_color)
-
-                    for event in event_dict[actual_date]:
-                        wrapped_lines = self.wrap_text(
-                            event, max_event_width, event_font
-                        )
-                        for line in wrapped_lines:
-                            if event_y_position + 12 > cell_bottom:
-                                logger.warning(
-                                    f"Event text overflowed in cell: {actual_date}."
-                                )
-                                break
-                            draw.text(
-                                (cell_left + event_x_offset, event_y_position),
-                                line,
-                                fill=fill_color,
-                                font=event_font,
-                            )
-                            event_y_position += 12
-                        if event_y_position + 12 > cell_bottom:
-                            break
+        return tile
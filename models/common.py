@@ -1,15 +1,96 @@
+import asyncio
 import calendar
 import ctypes
+import functools
+import logging
+import os
 import platform
+import stat
 import subprocess
+from datetime import date
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from config.config import Config
-from models.calendar_image_gen import CalendarImageGen
 from utils.logger import setup_logger
 
+if TYPE_CHECKING:
+    from models.calendar_image_gen import CalendarImageGen
+
 logger = setup_logger(name="shared_logger")
 
+# Image formats accepted by set_wallpaper
+_SUPPORTED_FORMATS = frozenset({".bmp", ".jpg", ".jpeg", ".png"})
+_SUPPORTED_FORMATS_STR = ", ".join(sorted(_SUPPORTED_FORMATS))
+
+_GNOME_BACKGROUND_SCHEMA = "org.gnome.desktop.background"
+
+# AppleScript that sets the desktop picture; the path is passed as argv, so
+# the script text is built once instead of on every call
+_MACOS_WALLPAPER_SCRIPT = (
+    "-e",
+    "on run argv",
+    "-e",
+    'tell application "System Events" to set desktop picture to POSIX file (item 1 of argv)',
+    "-e",
+    "end run",
+)
+
+# The OS cannot change while the process runs, so look it up once
+_OS = platform.system().lower()
+
+# Resolve SystemParametersInfoW once, with an explicit signature
+if _OS == "windows":
+    _user32 = ctypes.WinDLL("user32", use_last_error=True)
+    _SystemParametersInfoW = _user32.SystemParametersInfoW
+    _SystemParametersInfoW.argtypes = [
+        ctypes.c_uint,
+        ctypes.c_uint,
+        ctypes.c_wchar_p,
+        ctypes.c_uint,
+    ]
+    _SystemParametersInfoW.restype = ctypes.c_int
+    _SPI_GETDESKWALLPAPER = 0x0073
+
+# (path, mtime, size) of the image last applied successfully by set_wallpaper
+_last_wallpaper_state: tuple | None = None
+
+# Generator shared by every publish call (keeps its font/tile/template caches)
+_app: "CalendarImageGen | None" = None
+
+# Inputs of the last rendered image; an identical key means the file is current
+_last_render_key: tuple | None = None
+
+
+def _get_app() -> "CalendarImageGen":
+    """
+    Returns the module-level CalendarImageGen, creating it on first use.
+    """
+    global _app
+    if _app is None:
+        # Imported here so set_wallpaper callers never load PIL
+        from models.calendar_image_gen import CalendarImageGen
+
+        _app = CalendarImageGen(Config)
+    return _app
+
+
+def _db_state(db_file: Path) -> tuple:
+    """
+    Returns (mtime, size) of the events database and its WAL file. Any committed
+    write changes one of them, so an equal state means the events are unchanged.
+    An empty WAL file (created by the first reader) counts as missing.
+    """
+    state = []
+    for path in (db_file, db_file.with_name(f"{db_file.name}-wal")):
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            state.append(None)
+            continue
+        state.append((st.st_mtime_ns, st.st_size) if st.st_size else None)
+    return tuple(state)
+
 
 def publish_calendar_image(
     year: int,
@@ -27,15 +108,32 @@ def publish_calendar_image(
         start_of_week (str): The first day of the week. Can be "sun" or "mon".
         should_set_wallpaper (bool): Flag to set the generated image as wallpaper.
     """
+    global _last_render_key
 
     start_of_week = calendar.SUNDAY if start_of_week == "sun" else calendar.MONDAY
 
-    # Generate calendar image
-    app = CalendarImageGen(Config)
-    # Read events from DB
-    events = app.read_events_db(app.cfg.EVENTS_DB_FILE)
-    logger.debug(f"{year}, {month}, {events}, {start_of_week}")
-    app.draw_calendar(year, month, events, start_of_week)
+    app = _get_app()
+    db_file = Path(app.cfg.EVENTS_DB_FILE)
+
+    # Skip reading events and drawing when nothing that affects the image
+    # changed since the last render. The state is taken before reading, so a
+    # commit landing during the read changes the next key
+    render_key = (year, month, start_of_week, date.today(), _db_state(db_file))
+    if render_key == _last_render_key and app.cfg.WALLPAPER_FILE.exists():
+        logger.info("Calendar unchanged since last render, reusing image.")
+    else:
+        # Read events from DB
+        events = app.read_events_db(year, month, db_file)
+        # Forget the previous render first: if drawing raises, the old image on
+        # disk must not be mistaken for a current one
+        _last_render_key = None
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"{year}, {month}, {events}, {start_of_week}")
+        app.draw_calendar(year, month, events or {}, start_of_week)
+        # Only a successful read and draw may be reused; a failed read is
+        # retried next time
+        if events is not None:
+            _last_render_key = render_key
 
     # If user requested, set the calendar image as wallpaper
     if update_wallpaper:
@@ -53,86 +151,238 @@ def set_wallpaper(image: Path) -> None:
         image (Path): The absolute path to the image file to be set as wallpaper.
                        Supported formats include .bmp, .jpg, .jpeg, .png.
     """
-    SUPPORTED_FORMATS = {".bmp", ".jpg", ".jpeg", ".png"}
+    global _last_wallpaper_state
+
     image_str = str(image)
 
     # Validate image file format
-    if image.suffix.lower() not in SUPPORTED_FORMATS:
+    if image.suffix.lower() not in _SUPPORTED_FORMATS:
         logger.error(
-            f"Error: Unsupported file format '{image.suffix}'. Supported formats are: {', '.join(SUPPORTED_FORMATS)}"
+            f"Error: Unsupported file format '{image.suffix}'. Supported formats are: {_SUPPORTED_FORMATS_STR}"
         )
         return
 
-    # Ensure the path exists
-    if not image.exists():
+    # Ensure the path exists and is a regular file (one stat call)
+    try:
+        st = os.stat(image)
+    except FileNotFoundError:
         logger.error(f"Error: Image file not found at '{image}'")
         return
+    if not stat.S_ISREG(st.st_mode):
+        logger.error(f"Error: Image path is not a regular file: '{image}'")
+        return
 
-    # Get the operating system
-    os_name = platform.system().lower()
+    # The output path never changes, so compare the file's mtime/size too: a
+    # re-rendered image must still be re-applied. The wallpaper may also have
+    # been changed outside this process, so the OS must still report it
+    wallpaper_state = (image_str, st.st_mtime_ns, st.st_size)
+    if wallpaper_state == _last_wallpaper_state and _current_wallpaper() == image_str:
+        logger.info(f"Wallpaper already set to current '{image}', skipping.")
+        return
 
-    if os_name == "windows":
-        set_wallpaper_windows(image_str)
-    elif os_name == "darwin":  # macOS
-        set_wallpaper_macos(image_str)
-    elif os_name == "linux":
-        set_wallpaper_linux(image_str)
-    else:
-        logger.error(f"Unsupported OS: {os_name}")
+    if _SET_WALLPAPER_IMPL is None:
+        logger.error(f"Unsupported OS: {_OS}")
+        return
+
+    if _SET_WALLPAPER_IMPL(image_str):
+        _last_wallpaper_state = wallpaper_state
+
+
+async def set_wallpaper_async(image: Path) -> None:
+    """
+    Awaitable set_wallpaper for async callers (schedulers, web handlers).
 
+    The platform setters block on a subprocess or a system call, so they run in
+    a worker thread and the event loop keeps serving other tasks meanwhile.
 
-def set_wallpaper_windows(image: str) -> None:
-    """Sets wallpaper on Windows."""
+    Args:
+        image (Path): The absolute path to the image file to be set as wallpaper.
+    """
+    await asyncio.to_thread(set_wallpaper, image)
+
+
+def set_wallpaper_windows(image: str) -> bool:
+    """Sets wallpaper on Windows. Returns True on success."""
     SPI_SETDESKWALLPAPER = 20
     SPIF_UPDATEINIFILE = 0x01
     SPIF_SENDCHANGE = 0x02
     flags = SPIF_UPDATEINIFILE | SPIF_SENDCHANGE
 
     # Call the SystemParametersInfoW function to set the wallpaper
-    ctypes.windll.user32.SystemParametersInfoW(
+    if not _SystemParametersInfoW(
         SPI_SETDESKWALLPAPER,
         0,  # Not used for setting wallpaper
         image,
         flags,
-    )
+    ):
+        error = ctypes.WinError(ctypes.get_last_error())
+        logger.error(f"Failed to set wallpaper on Windows: {error}")
+        return False
     logger.info(f"Desktop wallpaper set to: '{image}'")
+    return True
 
 
-def set_wallpaper_macos(image: str) -> None:
-    """Sets wallpaper on macOS."""
+def set_wallpaper_macos(image: str) -> bool:
+    """Sets wallpaper on macOS. Returns True on success."""
     try:
         # Use AppleScript to change wallpaper
-        applescript = f"""
-        tell application "System Events"
-            set desktop picture to POSIX file "{image}"
-        end tell
-        """
-        subprocess.run(["osascript", "-e", applescript], check=True)
+        subprocess.run(["osascript", *_MACOS_WALLPAPER_SCRIPT, image], check=True)
         logger.info(f"Desktop wallpaper set to: '{image}' on macOS")
+        return True
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to set wallpaper on macOS: {e}")
+        return False
 
 
-def set_wallpaper_linux(image: str) -> None:
-    """Sets wallpaper on Linux (GNOME)."""
+@functools.lru_cache(maxsize=1)
+def _gnome_background_settings():
+    """
+    Returns a Gio.Settings for the GNOME background schema, or None when
+    PyGObject or the schema is not available. Created once per process.
+    """
     try:
-        # Use gsettings for GNOME (other desktop environments may require different tools)
-        subprocess.run(
-            [
-                "gsettings",
-                "set",
-                "org.gnome.desktop.background",
-                "picture-uri",
-                f"file://{image}",
-            ],
+        from gi.repository import Gio
+    except ImportError:
+        return None
+
+    source = Gio.SettingsSchemaSource.get_default()
+    if source is None or source.lookup(_GNOME_BACKGROUND_SCHEMA, True) is None:
+        return None
+    return Gio.Settings.new(_GNOME_BACKGROUND_SCHEMA)
+
+
+def _run_wallpaper_command(args: list[str], desktop: str) -> bool:
+    """
+    Runs a wallpaper tool. Returns True on success; a failing or missing tool
+    is logged and returns False.
+    """
+    try:
+        subprocess.run(args, check=True)
+        return True
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        logger.error(f"Failed to set wallpaper on Linux ({desktop}): {e}")
+        return False
+
+
+def _set_wallpaper_gnome(image: str) -> bool:
+    """Sets wallpaper on GNOME, in-process through Gio or with gsettings."""
+    uri = f"file://{image}"
+
+    # In-process DConf write through Gio when PyGObject is installed
+    settings = _gnome_background_settings()
+    if settings is not None and settings.set_string("picture-uri", uri):
+        settings.sync()
+        return True
+
+    return _run_wallpaper_command(
+        ["gsettings", "set", _GNOME_BACKGROUND_SCHEMA, "picture-uri", uri], "GNOME"
+    )
+
+
+def _set_wallpaper_kde(image: str) -> bool:
+    """Sets wallpaper on KDE Plasma (5.24+)."""
+    return _run_wallpaper_command(["plasma-apply-wallpaperimage", image], "KDE")
+
+
+def _set_wallpaper_xfce(image: str) -> bool:
+    """Sets wallpaper on XFCE, for every monitor and workspace backdrop."""
+    try:
+        result = subprocess.run(
+            ["xfconf-query", "-c", "xfce4-desktop", "-l"],
             check=True,
+            capture_output=True,
+            text=True,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        logger.error(f"Failed to set wallpaper on Linux (XFCE): {e}")
+        return False
+
+    properties = [
+        prop for prop in result.stdout.split() if prop.endswith("/last-image")
+    ]
+    if not properties:
+        logger.error("Failed to set wallpaper on Linux (XFCE): no backdrop found")
+        return False
+    # Set every backdrop before checking, so one failure does not skip the rest
+    results = [
+        _run_wallpaper_command(
+            ["xfconf-query", "-c", "xfce4-desktop", "-p", prop, "-s", image], "XFCE"
         )
+        for prop in properties
+    ]
+    return all(results)
+
+
+def _set_wallpaper_sway(image: str) -> bool:
+    """Sets wallpaper on sway (swaymsg restarts swaybg with the new image)."""
+    return _run_wallpaper_command(
+        ["swaymsg", "output", "*", "bg", image, "fill"], "sway"
+    )
+
+
+def _set_wallpaper_feh(image: str) -> bool:
+    """Sets wallpaper with 'feh', for plain X11 window managers."""
+    return _run_wallpaper_command(["feh", "--bg-scale", image], "feh")
+
+
+# Wallpaper backends by XDG_CURRENT_DESKTOP entry
+_LINUX_DESKTOP_BACKENDS = {
+    "GNOME": _set_wallpaper_gnome,
+    "KDE": _set_wallpaper_kde,
+    "XFCE": _set_wallpaper_xfce,
+    "sway": _set_wallpaper_sway,
+}
+
+
+def _detect_linux_backend():
+    """
+    Picks the wallpaper backend from XDG_CURRENT_DESKTOP (a colon-separated
+    list such as 'ubuntu:GNOME'). When it is unset (cron, systemd timers) or
+    unknown (Unity, Pantheon and other GNOME-schema desktops), GNOME is tried
+    first; set_wallpaper_linux still falls back to feh if that fails.
+    """
+    for desktop in os.environ.get("XDG_CURRENT_DESKTOP", "").split(":"):
+        if desktop in _LINUX_DESKTOP_BACKENDS:
+            return _LINUX_DESKTOP_BACKENDS[desktop]
+    return _set_wallpaper_gnome
+
+
+# The desktop session does not change while the process runs
+_LINUX_BACKEND = _detect_linux_backend() if _OS == "linux" else None
+
+
+def set_wallpaper_linux(image: str) -> bool:
+    """Sets wallpaper on Linux for the detected desktop. Returns True on success."""
+    if _LINUX_BACKEND(image):
         logger.info(f"Desktop wallpaper set to: '{image}' on Linux")
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to set wallpaper on Linux: {e}")
-        # Try using 'feh' as an alternative if gsettings fails
-        try:
-            subprocess.run(["feh", "--bg-scale", image], check=True)
-            logger.info(f"Desktop wallpaper set to: '{image}' using 'feh' on Linux")
-        except subprocess.CalledProcessError:
-            logger.error("Failed to set wallpaper using 'feh' on Linux.")
+        return True
+
+    # Try using 'feh' as an alternative if the desktop's own tool fails
+    if _set_wallpaper_feh(image):
+        logger.info(f"Desktop wallpaper set to: '{image}' using 'feh' on Linux")
+        return True
+    return False
+
+
+def _current_wallpaper() -> str | None:
+    """
+    Returns the wallpaper path the OS currently reports, or None when it cannot
+    be read in-process on this platform (then set_wallpaper never skips).
+    """
+    if _OS == "windows":
+        buffer = ctypes.create_unicode_buffer(260)  # MAX_PATH
+        if _SystemParametersInfoW(_SPI_GETDESKWALLPAPER, len(buffer), buffer, 0):
+            return buffer.value
+    elif _OS == "linux" and _LINUX_BACKEND is _set_wallpaper_gnome:
+        settings = _gnome_background_settings()
+        if settings is not None:
+            return settings.get_string("picture-uri").removeprefix("file://")
+    return None
+
+
+# Wallpaper setter for the current OS, or None when it is not supported
+_SET_WALLPAPER_IMPL = {
+    "windows": set_wallpaper_windows,
+    "darwin": set_wallpaper_macos,  # macOS
+    "linux": set_wallpaper_linux,
+}.get(_OS)
@@ -1,3 +1,4 @@
+import functools
 import logging
 from pathlib import Path
 
@@ -12,42 +13,58 @@ LOG_LEVELS = {
     "CRITICAL": logging.CRITICAL,
 }
 
+# Shared by every handler created here
+FORMATTER = logging.Formatter(
+    "%(asctime)s - %(name)s -  %(levelname)s -  %(funcName)s - %(message)s"
+)
+
+
+@functools.cache
+def _shared_handlers(log_path: Path) -> tuple[logging.Handler, logging.Handler]:
+    """
+    Returns the (file, stream) handler pair for a log file, creating it once.
+    Every logger writing to the same file shares these, so the file is opened
+    by a single handler instead of one per logger.
+    """
+    # Ensure the log directory exists using pathlib
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Create a file handler that logs to a file (opened on first record)
+    file_handler = logging.FileHandler(log_path, delay=True)
+    file_handler.setFormatter(FORMATTER)
+
+    # Create a stream handler to log to the console (stdout)
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(FORMATTER)
+
+    return file_handler, stream_handler
+
 
 def setup_logger(
     name="app_logger",
-    log_file=Config.LOG_FILE,
+    log_file=None,
     log_level_str="ERROR",
 ):
-    # Create a Path object for the log file
-    log_path = Path(log_file)
+    # Create a logger
+    logger = logging.getLogger(name)
 
-    # Ensure the log directory exists using pathlib
-    log_path.parent.mkdir(parents=True, exist_ok=True)
+    # Already configured: return it as-is instead of stacking more handlers
+    if logger.handlers:
+        return logger
+
+    # Resolve the default at call time so a patched Config is honoured
+    if log_file is None:
+        log_file = Config.LOG_FILE
 
     # Map string log level to logging constant
     log_level = LOG_LEVELS.get(
         log_level_str.upper(), logging.INFO
     )  # Default to INFO if invalid
 
-    # Create a logger
-    logger = logging.getLogger(name)
     logger.setLevel(log_level)
 
-    # Create a formatter that formats the log output
-    formatter = logging.Formatter(
-        "%(asctime)s - %(name)s -  %(levelname)s -  %(funcName)s - %(message)s"
-    )
-
-    # Create a file handler that logs to a file
-    file_handler = logging.FileHandler(log_file)
-    file_handler.setFormatter(formatter)
-
-    # Create a stream handler to log to the console (stdout)
-    stream_handler = logging.StreamHandler()
-    stream_handler.setFormatter(formatter)
-
-    # Add handlers to the logger
-    logger.addHandler(file_handler)
-    logger.addHandler(stream_handler)
+    # Add the handlers shared by all loggers of this log file
+    for handler in _shared_handlers(Path(log_file)):
+        logger.addHandler(handler)
 
     return logger
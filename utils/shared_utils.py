@@ -1,7 +1,14 @@
+import functools
+import logging
+from collections.abc import Iterable
+from datetime import datetime
+
 from utils.logger import setup_logger
 
 logger = setup_logger(name="shared_utils_logger")
 
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
 
 def hex_to_rgb(hex_code: str | tuple) -> tuple[int, int, int]:
     """
@@ -12,7 +19,63 @@ def hex_to_rgb(hex_code: str | tuple) -> tuple[int, int, int]:
     """
     if isinstance(hex_code, tuple):
         return hex_code
+    return _hex_to_rgb_cached(hex_code)
+
+
+@functools.lru_cache(maxsize=256)
+def _hex_to_rgb_cached(hex_code: str) -> tuple[int, int, int]:
+    """
+    Parses a hex color string. Cached, since palettes reuse a handful of colors.
+    """
     hex_code = hex_code.lstrip("#")
-    rgb = tuple(int(hex_code[i : i + 2], 16) for i in (0, 2, 4))
-    logger.debug(f"HEX: '{hex_code}' -> RGB {rgb}")
+    if len(hex_code) == 6 and _HEX_DIGITS.issuperset(hex_code):
+        # Common '#RRGGBB' case: one int parse and shifts, no bytes object.
+        # Checked first: int() would also accept '0x', signs, '_' and spaces
+        n = int(hex_code, 16)
+        rgb = (n >> 16 & 0xFF, n >> 8 & 0xFF, n & 0xFF)
+    else:
+        # bytes.fromhex decodes all pairs in one C call
+        b = bytes.fromhex(hex_code)
+        rgb = (b[0], b[1], b[2])
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"HEX: '{hex_code}' -> RGB {rgb}")
     return rgb
+
+
+def hex_to_rgb_many(
+    hex_codes: Iterable[str | tuple],
+) -> list[tuple[int, int, int]]:
+    """
+    Converts many 6-digit hex color codes (e.g., ['#525252', '#FFFFFF']) to RGB
+    tuples, decoding them all with a single bytes.fromhex call. RGB tuples are
+    passed through, as in hex_to_rgb.
+
+    :param hex_codes: The hex color codes as strings or RGB tuples
+    :return: List of tuples with RGB values, in input order
+    :raises ValueError: If a string is not a 6-digit hex color code
+    """
+    codes = list(hex_codes)
+    digits = [code.lstrip("#") for code in codes if not isinstance(code, tuple)]
+    for code in digits:
+        if len(code) != 6 or not _HEX_DIGITS.issuperset(code):
+            raise ValueError(f"Expected a 6-digit hex color code, got '{code}'.")
+    data = bytes.fromhex("".join(digits))
+    decoded = zip(data[0::3], data[1::3], data[2::3])
+    return [code if isinstance(code, tuple) else next(decoded) for code in codes]
+
+
+def parse_event_datetime(value: str) -> datetime:
+    """
+    Parses an event datetime as stored in the events database.
+
+    Uses datetime.fromisoformat, falling back to strptime for rows written
+    before zero-padding was enforced (e.g., '2025-10-05 7:00').
+
+    :param value: The datetime string, e.g. '2025-10-05 07:00'
+    :return: The parsed datetime
+    :raises ValueError: If the string matches neither format
+    """
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, "%Y-%m-%d %H:%M")